@@ -22,17 +22,22 @@ import math
 import random
 import time
 import tkinter as tk
-from dataclasses import dataclass
 
 
 # ----------------------------
 # Math helpers (2D vectors)
 # ----------------------------
 
-@dataclass
 class Vec:
-    x: float
-    y: float
+    # Plain slotted class: cheaper to build and read than a dataclass instance
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+    def __repr__(self) -> str:
+        return f"Vec(x={self.x!r}, y={self.y!r})"
 
     def __add__(self, o: "Vec") -> "Vec":
         return Vec(self.x + o.x, self.y + o.y)
@@ -54,8 +59,123 @@ class Vec:
         return Vec(0.0, 0.0) if m == 0 else Vec(self.x / m, self.y / m)
 
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return lo if v < lo else hi if v > hi else v
+# ----------------------------
+# Collision kernels (plain floats only)
+# ----------------------------
+
+def collide_segments(bx: float, by: float, bvx: float, bvy: float, r: float,
+                     geom: list[tuple[float, ...]]) -> tuple[float, float, float, float, list[int]]:
+    """
+    Push the ball out of / bounce it off every static segment it overlaps.
+
+    geom holds (index, minx, maxx, miny, maxy, x1, y1, vx, vy, 1/|v|^2, nx, ny, restitution)
+    per segment, with the bounds already grown by the ball radius.
+    Returns the new ball state plus the indices of the segments that were hit,
+    so the caller can apply scoring/effects.
+    """
+    hits: list[int] = []
+    r2 = r * r
+    sqrt = math.sqrt
+    for i, minx, maxx, miny, maxy, x1, y1, vx, vy, inv_vv, snx, sny, restitution in geom:
+        if bx < minx or bx > maxx or by < miny or by > maxy:
+            continue
+
+        # Closest point on segment to ball center
+        t = ((bx - x1) * vx + (by - y1) * vy) * inv_vv
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+        dx = bx - (x1 + vx * t)
+        dy = by - (y1 + vy * t)
+        dist2 = dx * dx + dy * dy
+        if dist2 >= r2:
+            continue
+
+        # Push out along normal
+        dist = sqrt(dist2)
+        if dist == 0:
+            nx, ny = snx, sny
+        else:
+            inv = 1.0 / dist
+            nx = dx * inv
+            ny = dy * inv
+        overlap = r - dist
+        bx += nx * overlap
+        by += ny * overlap
+
+        # Reflect velocity: v' = v - (1+e)(v·n)n, unless it is already moving away
+        dot = bvx * nx + bvy * ny
+        if dot < 0:
+            bvx -= (1 + restitution) * dot * nx
+            bvy -= (1 + restitution) * dot * ny
+        hits.append(i)
+
+    return bx, by, bvx, bvy, hits
+
+
+def sweep_segments(bx: float, by: float, dx: float, dy: float, r: float,
+                   geom: list[tuple[float, ...]]) -> tuple[float, int, float, float] | None:
+    """
+    Find where the ball, moving by (dx, dy) this step, first touches a segment in geom.
+
+    Each segment is a capsule of radius r (two faces + two rounded ends), so this is a
+    ray cast of the ball centre. Returns (t, index, nx, ny) for the earliest contact,
+    t in [0, 1] and n pointing back towards the ball, or None. Segments the ball already
+    overlaps are skipped; collide_segments pushes the ball out of those.
+    """
+    dd = dx * dx + dy * dy
+    if dd == 0:
+        return None
+
+    best = None
+    best_t = 1.0
+    r2 = r * r
+    sqrt = math.sqrt
+    for i, _minx, _maxx, _miny, _maxy, x1, y1, vx, vy, inv_vv, snx, sny, _e in geom:
+        ox = bx - x1
+        oy = by - y1
+
+        # Faces: signed distance of the centre from the segment's line
+        s0 = ox * snx + oy * sny
+        dn = dx * snx + dy * sny
+        if s0 >= r:
+            if dn >= 0:
+                continue  # on the outer side and moving away: can't touch the face or ends
+            side = 1.0
+            t = (r - s0) / dn
+        elif s0 <= -r:
+            if dn <= 0:
+                continue
+            side = -1.0
+            t = (-r - s0) / dn
+        else:
+            if 0.0 <= (ox * vx + oy * vy) * inv_vv <= 1.0:
+                continue  # already overlapping
+            t = 2.0  # beside the line but past an end: only the end caps can be hit
+
+        if t <= best_t:
+            u = ((ox + dx * t) * vx + (oy + dy * t) * vy) * inv_vv
+            if 0.0 <= u <= 1.0:
+                # Entering through a face is the first contact with this capsule
+                best_t = t
+                best = (t, i, snx * side, sny * side)
+                continue
+
+        # Rounded ends: ray vs circle of radius r around each endpoint
+        for cx, cy in ((x1, y1), (x1 + vx, y1 + vy)):
+            mx = bx - cx
+            my = by - cy
+            b = mx * dx + my * dy
+            c = mx * mx + my * my - r2
+            if c <= 0 or b >= 0:
+                continue
+            disc = b * b - dd * c
+            if disc < 0:
+                continue
+            t = (-b - sqrt(disc)) / dd
+            if t <= best_t:
+                best_t = t
+                best = (t, i, (mx + dx * t) / r, (my + dy * t) / r)
+
+    return best
 
 
 # ----------------------------
@@ -97,11 +217,18 @@ class Segment:
         self.p1 = Vec(x1, y1)
         self.p2 = Vec(x2, y2)
         self.kind = kind  # wall / slingshot / lane / rail
-        dx = self.p2.x - self.p1.x
-        dy = self.p2.y - self.p1.y
-        ln = math.hypot(dx, dy) or 1.0
+        # Segments never move, so direction/length terms for collision are computed once
+        self.vx = x2 - x1
+        self.vy = y2 - y1
+        vv = self.vx * self.vx + self.vy * self.vy
+        self.inv_vv = 1.0 / (vv or 1.0)
+        ln = math.sqrt(vv) or 1.0
         # Left-hand normal
-        self.normal = Vec(-dy / ln, dx / ln)
+        self.nx = -self.vy / ln
+        self.ny = self.vx / ln
+        # Bounding box (broad-phase reject before the closest-point test)
+        self.minx, self.maxx = min(x1, x2), max(x1, x2)
+        self.miny, self.maxy = min(y1, y2), max(y1, y2)
 
 
 class Flipper:
@@ -113,6 +240,7 @@ class Flipper:
     def __init__(self, x: float, y: float, length: float, side: str, start_ang: float, max_ang: float) -> None:
         self.pivot = Vec(x, y)
         self.length = length
+        self.inv_len2 = 1.0 / (length * length or 1.0)  # |tip - pivot|^2 is constant while rotating
         self.side = side  # "left" or "right"
 
         # Left rests at +30deg, flips to -45deg.
@@ -123,6 +251,7 @@ class Flipper:
         self.angle = self.rest_angle
         self.target = self.rest_angle
         self.width = 10.0
+        self._update_pose()
 
     def set_pressed(self, pressed: bool) -> None:
         self.target = self.flip_angle if pressed else self.rest_angle
@@ -130,11 +259,24 @@ class Flipper:
     def update(self, speed: float) -> None:
         # Smooth move towards target (simple, stable, kid-friendly feel)
         self.angle += (self.target - self.angle) * speed
-
-    def tip(self) -> Vec:
-        return Vec(
-            self.pivot.x + math.cos(self.angle) * self.length,
-            self.pivot.y + math.sin(self.angle) * self.length,
+        self._update_pose()
+
+    def _update_pose(self) -> None:
+        # Angle only changes in update(), so collision + drawing reuse these
+        self.cos = math.cos(self.angle)
+        self.sin = math.sin(self.angle)
+        self.tip_x = self.pivot.x + self.cos * self.length
+        self.tip_y = self.pivot.y + self.sin * self.length
+
+        # Outline for drawing: thin rectangle around pivot->tip (perpendicular = (-sin, cos))
+        hx = -self.sin * self.width / 2
+        hy = self.cos * self.width / 2
+        px, py = self.pivot.x, self.pivot.y
+        self.corners = (
+            px + hx, py + hy,
+            px - hx, py - hy,
+            self.tip_x - hx, self.tip_y - hy,
+            self.tip_x + hx, self.tip_y + hy,
         )
 
 
@@ -147,6 +289,15 @@ class PinballGame:
     W = 400.0
     H = 700.0
 
+    # Physics timestep (seconds); gravity/friction/etc. are tuned per step.
+    # A stalled frame catches up at most MAX_STEPS steps instead of fast-forwarding.
+    STEP = 0.016
+    MAX_STEPS = 4
+
+    # Collision grid cell size (physics units)
+    CELL = 40.0
+    _EMPTY_CELL: tuple[list, list] = ([], [])
+
     # Neon palette
     BG = "#120a2e"
     BALL = "#ffffff"
@@ -161,7 +312,8 @@ class PinballGame:
         self.root.title("Neon Space Arcade Pinball (Python)")
         self.root.configure(bg="#05030f")
 
-        self.canvas = tk.Canvas(self.root, highlightthickness=0, bg=self.BG)
+        # Canvas bg doubles as the dark vignette border around the table
+        self.canvas = tk.Canvas(self.root, highlightthickness=0, bg="#05030f")
         self.canvas.pack(fill="both", expand=True)
 
         # UI state
@@ -177,16 +329,24 @@ class PinballGame:
 
         # Screen shake
         self.shake_frames = 0
+        self._shake_rng = random.getrandbits(31)
 
         # Scaling / viewport
         self.scale = 1.0
         self.offx = 0.0
         self.offy = 0.0
+        self._transform = (self.scale, self.offx, self.offy)
+        self._cw = 0  # canvas size in pixels, cached by _on_resize
+        self._ch = 0
 
         # Game objects
         self.ball = Ball(radius=10.0)
         self.segs: list[Segment] = []
         self.bumpers: list[Bumper] = []
+        self._seg_geom: list[tuple[float, ...]] = []
+        self._grid: dict[tuple[int, int], tuple[list, list]] = {}
+        self._max_x = self.W
+        self._drain_y = self.H
         self.left = Flipper(110, self.H - 60, 70, "left", start_ang=math.pi / 6, max_ang=math.pi / 4)
         self.right = Flipper(260, self.H - 60, 70, "right", start_ang=math.pi / 6, max_ang=math.pi / 4)
 
@@ -194,6 +354,10 @@ class PinballGame:
         self.left_down = False
         self.right_down = False
 
+        # Frame pacing (see _tick)
+        self._last_tick = time.perf_counter()
+        self._accum = 0.0
+
         # Scoring cooldown (prevents wall score spam while resting)
         self.frame = 0
         self.last_wall_score_frame = -999
@@ -201,6 +365,20 @@ class PinballGame:
         # Overlay button area (in screen pixels)
         self.btn_rect = (0, 0, 0, 0)
 
+        # Persistent canvas items (created by _build_scene on resize)
+        self._grid_img: tk.PhotoImage | None = None  # keep a reference, Tk doesn't
+        self._bumper_ids: list[tuple[int, int]] = []
+        self._bumper_fills: list[str] = []
+        self._flipper_ids: tuple[int, int] = (0, 0)
+        self._ball_id = 0
+        self._ball_shown = False
+        self._score_id = 0
+        self._lives_id = 0
+        self._hud = (0, 0)
+        self._shake_x = 0.0
+        self._shake_y = 0.0
+        self._overlay_state = ""
+
         self._build_table()
         self._bind_events()
 
@@ -258,16 +436,52 @@ class PinballGame:
         self.bumpers.append(Bumper(self.W / 2 - 60, 220, 25, self.BUMPER))
         self.bumpers.append(Bumper(self.W / 2 + 60, 220, 25, self.BUMPER))
 
+        # Flat segment geometry for collide_segments (segments never move), indexed like self.segs
+        self._seg_geom = []
+        r = self.ball.r
+        for i, seg in enumerate(self.segs):
+            restitution = 1.5 if seg.kind == "slingshot" else self.wall_bounce
+            self._seg_geom.append((i, seg.minx - r, seg.maxx + r, seg.miny - r, seg.maxy + r,
+                                   seg.p1.x, seg.p1.y, seg.vx, seg.vy, seg.inv_vv, seg.nx, seg.ny, restitution))
+
+        # Spatial hash: every cell lists the segments/bumpers whose (radius-grown) box covers it,
+        # so the ball only has to look at the cell its centre is in.
+        self._grid = {}
+        for geom in self._seg_geom:
+            for cell in self._cells(geom[1], geom[2], geom[3], geom[4]):
+                self._grid.setdefault(cell, ([], []))[0].append(geom)
+        for b in self.bumpers:
+            reach = r + b.r
+            for cell in self._cells(b.pos.x - reach, b.pos.x + reach, b.pos.y - reach, b.pos.y + reach):
+                self._grid.setdefault(cell, ([], []))[1].append(b)
+
+        # Ball-centre limits for the float clamps in _step_ball/_resolve_collisions
+        self._max_x = self.W - r
+        self._drain_y = self.H + 50
+
+    def _cells(self, minx: float, maxx: float, miny: float, maxy: float) -> list[tuple[int, int]]:
+        c = self.CELL
+        return [(cx, cy)
+                for cx in range(int(minx // c), int(maxx // c) + 1)
+                for cy in range(int(miny // c), int(maxy // c) + 1)]
+
     # ----------------------------
     # Coordinate transforms
     # ----------------------------
 
     def _on_resize(self) -> None:
+        # <Configure> also fires for window moves and child widgets; only a new size matters
         cw = max(1, self.canvas.winfo_width())
         ch = max(1, self.canvas.winfo_height())
+        if (cw, ch) == (self._cw, self._ch):
+            return
+        self._cw, self._ch = cw, ch
+
         self.scale = min(cw / self.W, ch / self.H)
         self.offx = (cw - self.W * self.scale) / 2
         self.offy = (ch - self.H * self.scale) / 2
+        self._transform = (self.scale, self.offx, self.offy)
+        self._build_scene()
 
     def _sx(self, x: float) -> float:
         return self.offx + x * self.scale
@@ -278,6 +492,74 @@ class PinballGame:
     def _sw(self, w: float) -> float:
         return w * self.scale
 
+    def _build_scene(self) -> None:
+        """
+        Create every canvas item once for the current viewport.
+        _render then only moves/recolours these items instead of redrawing the table.
+        """
+        self.canvas.delete("all")
+        self._shake_x = 0.0
+        self._shake_y = 0.0
+        self._overlay_state = ""
+
+        # Background: the canvas itself is the dark border, only the table needs an item
+        self.canvas.create_rectangle(self._sx(0), self._sy(0), self._sx(self.W), self._sy(self.H), fill=self.BG, outline="")
+
+        # Neon grid (subtle)
+        # Painted once into a transparent image, so it is a single canvas item
+        grid_color = "#2a1655"
+        step = 40
+        gw = int(self._sw(self.W)) + 1
+        gh = int(self._sw(self.H)) + 1
+        self._grid_img = tk.PhotoImage(width=gw, height=gh)
+        for gx in range(0, int(self.W) + 1, step):
+            x = min(int(round(self._sw(gx))), gw - 1)
+            self._grid_img.put(grid_color, to=(x, 0, x + 1, gh))
+        for gy in range(0, int(self.H) + 1, step):
+            y = min(int(round(self._sw(gy))), gh - 1)
+            self._grid_img.put(grid_color, to=(0, y, gw, y + 1))
+        self.canvas.create_image(self._sx(0), self._sy(0), image=self._grid_img, anchor="nw", tags="shake")
+
+        # Segments (walls), moved only through the "shake" tag
+        for seg in self.segs:
+            color = self.SLING if seg.kind == "slingshot" else self.WALL
+            w = self._sw(5)
+            pts = (self._sx(seg.p1.x), self._sy(seg.p1.y), self._sx(seg.p2.x), self._sy(seg.p2.y))
+            # Faux glow: the wide line is the same colour as the core, so one item draws both
+            self.canvas.create_line(pts, fill=color, width=w + self._sw(6), capstyle="round", tags="shake")
+
+        # Bumpers
+        self._bumper_ids = []
+        for b in self.bumpers:
+            outer = self.canvas.create_oval(self._sx(b.pos.x - b.r), self._sy(b.pos.y - b.r),
+                                            self._sx(b.pos.x + b.r), self._sy(b.pos.y + b.r),
+                                            fill=b.base_color, outline="", tags="shake")
+            # inner ring
+            inner = self.canvas.create_oval(self._sx(b.pos.x - b.r * 0.6), self._sy(b.pos.y - b.r * 0.6),
+                                            self._sx(b.pos.x + b.r * 0.6), self._sy(b.pos.y + b.r * 0.6),
+                                            outline="#330033", width=self._sw(2), tags="shake")
+            self._bumper_ids.append((outer, inner))
+        self._bumper_fills = [b.base_color for b in self.bumpers]
+
+        # Flippers (corners are filled in every frame by _draw_flipper)
+        self._flipper_ids = (
+            self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=self.FLIPPER, outline=""),
+            self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=self.FLIPPER, outline=""),
+        )
+
+        # Ball, hidden until a ball is in play. The glow is the outline: it is centred on
+        # the oval edge, so a 1.3r oval with a 0.6r outline spans r..1.6r around the core.
+        self._ball_id = self.canvas.create_oval(0, 0, 0, 0, fill=self.BALL, outline="#cccccc",
+                                                width=self._sw(self.ball.r * 0.6), state="hidden")
+        self._ball_shown = False
+
+        # HUD (score + lives)
+        self._score_id = self.canvas.create_text(self._sx(self.W / 2), self._sy(40), text=str(self.score),
+                                                 fill=self.TARGET, font=("Arial Black", int(self._sw(28))))
+        self._lives_id = self.canvas.create_text(self._sx(self.W / 2), self._sy(78), text=f"BALLS: {self.lives}",
+                                                 fill=self.FLIPPER, font=("Verdana", int(self._sw(14)), "bold"))
+        self._hud = (self.score, self.lives)
+
     # ----------------------------
     # Input
     # ----------------------------
@@ -346,272 +628,332 @@ class PinballGame:
     # ----------------------------
 
     def _tick(self) -> None:
-        # Fixed timestep-ish at ~60 fps using tkinter "after"
-        self.frame += 1
+        # Fixed physics timestep driven by the real clock: "after" only schedules the next
+        # frame, the accumulator decides how many STEPs actually happened since the last one.
+        now = time.perf_counter()
+        elapsed = min(now - self._last_tick, self.STEP * self.MAX_STEPS)
+        self._last_tick = now
+
+        if self.state != "playing" and self._overlay_state == self.state:
+            # Overlay is up and covers the whole table: nothing to animate until PLAY is clicked
+            self._accum = 0.0
+            self.root.after(100, self._tick)
+            return
 
         if self.state == "playing":
-            # Update flippers
-            self.left.set_pressed(self.left_down)
-            self.right.set_pressed(self.right_down)
-            self.left.update(self.flipper_speed)
-            self.right.update(self.flipper_speed)
-
-            # Update ball
-            self._step_ball()
+            self._accum += elapsed
+            # Stop as soon as a step ends the game (last ball drained)
+            while self._accum >= self.STEP and self.state == "playing":
+                self._accum -= self.STEP
+                self.frame += 1
+
+                # Update flippers
+                self.left.set_pressed(self.left_down)
+                self.right.set_pressed(self.right_down)
+                self.left.update(self.flipper_speed)
+                self.right.update(self.flipper_speed)
+
+                # Update ball
+                self._step_ball()
+        else:
+            self._accum = 0.0
 
         self._render()
-        self.root.after(16, self._tick)
+
+        # Aim the next tick at one STEP after this one started
+        spent_ms = (time.perf_counter() - now) * 1000
+        self.root.after(max(1, int(self.STEP * 1000 - spent_ms)), self._tick)
 
     def _step_ball(self) -> None:
-        if not self.ball.active:
+        ball = self.ball
+        if not ball.active or self._ball_resting_in_lane():
             return
 
-        # Apply gravity + integrate
-        self.ball.vel = Vec(self.ball.vel.x * self.friction, (self.ball.vel.y + self.gravity) * self.friction)
-        self.ball.pos = self.ball.pos + self.ball.vel
+        # Work on plain floats; the ball's Vecs are written back once at the end
+        r = ball.r
+        pos, vel = ball.pos, ball.vel
+        friction = self.friction
+
+        # Apply gravity
+        bvx = vel.x * friction
+        bvy = (vel.y + self.gravity) * friction
+        bx = pos.x
+        by = pos.y
+
+        # Integrate with a swept test against the walls: stop at the first segment in the
+        # way, bounce, and spend the rest of the step on the new heading (at most 2 bounces).
+        # Thin walls can't be tunnelled through, so one overlap pass below is enough.
+        remaining = 1.0
+        for _ in range(2):
+            mx = bvx * remaining
+            my = bvy * remaining
+            hit = sweep_segments(bx, by, mx, my, r, self._sweep_candidates(bx, by, bx + mx, by + my))
+            if hit is None:
+                break
+            t, i, nx, ny = hit
+            bx += mx * t
+            by += my * t
+            restitution = self._seg_geom[i][-1]
+            dot = bvx * nx + bvy * ny
+            bvx -= (1 + restitution) * dot * nx
+            bvy -= (1 + restitution) * dot * ny
+            self._score_segment_hit(self.segs[i])
+            remaining *= 1.0 - t
+        bx += bvx * remaining
+        by += bvy * remaining
 
         # Top clamp (prevents rare tunneling into upper corners)
-        if self.ball.pos.y < self.ball.r:
-            self.ball.pos = Vec(self.ball.pos.x, self.ball.r)
-            self.ball.vel = Vec(self.ball.vel.x, abs(self.ball.vel.y) * self.wall_bounce)
+        if by < r:
+            by = r
+            bvy = abs(bvy) * self.wall_bounce
 
-        # Lose ball if it falls out bottom
-        if self.ball.pos.y > self.H + 50:
+        # Lose ball if it falls out bottom (the lane reset / game over replaces the ball state)
+        if by > self._drain_y:
             self._lose_ball()
             return
 
-        # Collisions (2 passes reduce tunneling for simple engines)
-        self._resolve_collisions()
-        self._resolve_collisions()
-
-    def _resolve_collisions(self) -> None:
-        # Ball vs segments
-        for seg in self.segs:
-            self._collide_ball_segment(seg)
+        # Overlaps: bumpers, flippers, resting contact with walls
+        bx, by, bvx, bvy = self._resolve_collisions(bx, by, bvx, bvy)
+
+        ball.pos = Vec(bx, by)
+        ball.vel = Vec(bvx, bvy)
+
+    def _ball_resting_in_lane(self) -> bool:
+        # Ball settled on the plunger lane floor, waiting for launch
+        ball = self.ball
+        pos, vel = ball.pos, ball.vel
+        return (pos.x > self.W - 40 and pos.y >= self.H - 40 - ball.r - 0.5
+                and vel.x * vel.x + vel.y * vel.y < 0.05)
+
+    def _sweep_candidates(self, x0: float, y0: float, x1: float, y1: float) -> list[tuple[float, ...]]:
+        # Segments listed in any grid cell the step's bounding box touches
+        cell = self.CELL
+        cx0, cx1 = int(min(x0, x1) // cell), int(max(x0, x1) // cell)
+        cy0, cy1 = int(min(y0, y1) // cell), int(max(y0, y1) // cell)
+        if cx0 == cx1 and cy0 == cy1:
+            return self._grid.get((cx0, cy0), self._EMPTY_CELL)[0]
+
+        found: dict[int, tuple[float, ...]] = {}
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for geom in self._grid.get((cx, cy), self._EMPTY_CELL)[0]:
+                    found[geom[0]] = geom
+        return list(found.values())
+
+    def _resolve_collisions(self, bx: float, by: float, bvx: float, bvy: float) -> tuple[float, float, float, float]:
+        r = self.ball.r
+        cell = self.CELL
+
+        # Only what overlaps the ball's grid cell can touch it
+        segs, bumpers = self._grid.get((int(bx // cell), int(by // cell)), self._EMPTY_CELL)
+
+        # Ball vs segments (physics in the float kernel, scoring here)
+        bx, by, bvx, bvy, hits = collide_segments(bx, by, bvx, bvy, r, segs)
+        for i in hits:
+            self._score_segment_hit(self.segs[i])
 
         # Ball vs bumpers
-        for b in self.bumpers:
-            self._collide_ball_bumper(b)
+        for b in bumpers:
+            hit = self._collide_ball_bumper(b, bx, by, bvx, bvy)
+            if hit:
+                bx, by, bvx, bvy = hit
 
         # Ball vs flippers (as segments)
-        self._collide_ball_flipper(self.left)
-        self._collide_ball_flipper(self.right)
+        hit = self._collide_ball_flipper(self.left, bx, by, bvx, bvy)
+        if hit:
+            bx, by, bvx, bvy = hit
+        hit = self._collide_ball_flipper(self.right, bx, by, bvx, bvy)
+        if hit:
+            bx, by, bvx, bvy = hit
 
         # Simple left/right safety clamp (should be redundant with walls, but keeps it robust)
-        if self.ball.pos.x < self.ball.r:
-            self.ball.pos = Vec(self.ball.r, self.ball.pos.y)
-            self.ball.vel = Vec(-self.ball.vel.x * self.wall_bounce, self.ball.vel.y)
-        if self.ball.pos.x > self.W - self.ball.r:
-            self.ball.pos = Vec(self.W - self.ball.r, self.ball.pos.y)
-            self.ball.vel = Vec(-self.ball.vel.x * self.wall_bounce, self.ball.vel.y)
-
-    def _collide_ball_segment(self, seg: Segment) -> None:
-        # Closest point on segment to ball center
-        p1, p2 = seg.p1, seg.p2
-        v = p2 - p1
-        vv = v.dot(v) or 1.0
-        t = ((self.ball.pos - p1).dot(v)) / vv
-        t = clamp(t, 0.0, 1.0)
-        closest = p1 + v * t
-        d = self.ball.pos - closest
-        dist = d.mag()
-
-        if dist < self.ball.r:
-            # Push out along normal
-            n = d.norm()
-            if dist == 0:
-                n = seg.normal
-            overlap = self.ball.r - dist
-            self.ball.pos = self.ball.pos + n * overlap
-
-            # Reflect velocity: v' = v - (1+e)(v·n)n
-            dot = self.ball.vel.dot(n)
-            restitution = 1.5 if seg.kind == "slingshot" else self.wall_bounce
-            self.ball.vel = Vec(
-                self.ball.vel.x - (1 + restitution) * dot * n.x,
-                self.ball.vel.y - (1 + restitution) * dot * n.y,
-            )
-
-            # Scoring + effects
-            if seg.kind == "slingshot":
+        max_x = self._max_x
+        if bx < r:
+            bx = r
+            bvx = -bvx * self.wall_bounce
+        if bx > max_x:
+            bx = max_x
+            bvx = -bvx * self.wall_bounce
+
+        return bx, by, bvx, bvy
+
+    def _score_segment_hit(self, seg: Segment) -> None:
+        # Scoring + effects
+        if seg.kind == "slingshot":
+            self._add_score(10)
+            self._shake(4)
+        else:
+            # Wall = 10 points, but throttle so it doesn't spam
+            if self.frame - self.last_wall_score_frame > 6:
                 self._add_score(10)
-                self._shake(4)
-            else:
-                # Wall = 10 points, but throttle so it doesn't spam
-                if self.frame - self.last_wall_score_frame > 6:
-                    self._add_score(10)
-                    self.last_wall_score_frame = self.frame
-
-    def _collide_ball_bumper(self, b: Bumper) -> None:
-        d = self.ball.pos - b.pos
-        dist = d.mag()
-        if dist < self.ball.r + b.r:
-            n = d.norm() if dist != 0 else Vec(0, -1)
-            overlap = (self.ball.r + b.r) - dist
-            self.ball.pos = self.ball.pos + n * overlap
-
-            # Give it a strong bounce
-            speed = max(5.0, self.ball.vel.mag()) * 1.2
-            self.ball.vel = n * speed
-
-            b.hit()
-            self._add_score(100)
-            self._shake(8)
-
-    def _collide_ball_flipper(self, f: Flipper) -> None:
+                self.last_wall_score_frame = self.frame
+
+    def _collide_ball_bumper(self, b: Bumper,
+                             bx: float, by: float, bvx: float, bvy: float) -> tuple[float, float, float, float] | None:
+        pos = b.pos
+        dx = bx - pos.x
+        dy = by - pos.y
+        dist2 = dx * dx + dy * dy
+        reach = self.ball.r + b.r
+        if dist2 >= reach * reach:
+            return None
+
+        dist = math.sqrt(dist2)
+        if dist != 0:
+            inv = 1.0 / dist
+            nx = dx * inv
+            ny = dy * inv
+        else:
+            nx, ny = 0.0, -1.0
+        overlap = reach - dist
+        bx += nx * overlap
+        by += ny * overlap
+
+        # Give it a strong bounce
+        speed = max(5.0, math.sqrt(bvx * bvx + bvy * bvy)) * 1.2
+
+        b.hit()
+        self._add_score(100)
+        self._shake(8)
+        return bx, by, nx * speed, ny * speed
+
+    def _collide_ball_flipper(self, f: Flipper,
+                              bx: float, by: float, bvx: float, bvy: float) -> tuple[float, float, float, float] | None:
         # Flipper as a segment
-        p1 = f.pivot
-        p2 = f.tip()
-        v = p2 - p1
-        vv = v.dot(v) or 1.0
-        t = ((self.ball.pos - p1).dot(v)) / vv
-        t = clamp(t, 0.0, 1.0)
-        closest = p1 + v * t
-        d = self.ball.pos - closest
-        dist = d.mag()
+        pivot = f.pivot
+        x1, y1 = pivot.x, pivot.y
+        vx = f.tip_x - x1
+        vy = f.tip_y - y1
+        t = ((bx - x1) * vx + (by - y1) * vy) * f.inv_len2
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+        dx = bx - (x1 + vx * t)
+        dy = by - (y1 + vy * t)
+        dist2 = dx * dx + dy * dy
 
         flipper_r = 5.0
-        if dist < self.ball.r + flipper_r:
-            n = d.norm() if dist != 0 else Vec(0, -1)
-            overlap = (self.ball.r + flipper_r) - dist
-            self.ball.pos = self.ball.pos + n * overlap
-
-            dot = self.ball.vel.dot(n)
-            self.ball.vel = Vec(
-                self.ball.vel.x - 2 * dot * n.x,
-                self.ball.vel.y - 2 * dot * n.y,
-            )
-
-            # If flipper is moving upward, add a stronger impulse ("kick")
-            moving_up = (f.side == "left" and f.target < f.angle) or (f.side == "right" and f.target > f.angle)
-            if moving_up:
-                self.ball.vel = Vec(self.ball.vel.x + (5 if f.side == "left" else -5), self.ball.vel.y - 10)
-                self._shake(2)
-            else:
-                # resting contact friction
-                self.ball.vel = Vec(self.ball.vel.x * 0.95, self.ball.vel.y)
+        reach = self.ball.r + flipper_r
+        if dist2 >= reach * reach:
+            return None
+
+        dist = math.sqrt(dist2)
+        if dist != 0:
+            inv = 1.0 / dist
+            nx = dx * inv
+            ny = dy * inv
+        else:
+            nx, ny = 0.0, -1.0
+        overlap = reach - dist
+        bx += nx * overlap
+        by += ny * overlap
+
+        dot = bvx * nx + bvy * ny
+        bvx -= 2 * dot * nx
+        bvy -= 2 * dot * ny
+
+        # If flipper is moving upward, add a stronger impulse ("kick")
+        moving_up = (f.side == "left" and f.target < f.angle) or (f.side == "right" and f.target > f.angle)
+        if moving_up:
+            bvx += 5 if f.side == "left" else -5
+            bvy -= 10
+            self._shake(2)
+        else:
+            # resting contact friction
+            bvx *= 0.95
+
+        return bx, by, bvx, bvy
 
     # ----------------------------
     # Rendering
     # ----------------------------
 
     def _render(self) -> None:
-        self.canvas.delete("all")
-
         # Screen shake (in screen pixels, scaled)
-        shake_px = 0.0
+        sx = sy = 0.0
         if self.shake_frames > 0:
             shake_px = (self.shake_frames * 0.8)
             self.shake_frames -= 1
 
-        sx = random.uniform(-shake_px, shake_px)
-        sy = random.uniform(-shake_px, shake_px)
-
-        def X(x: float) -> float:
-            return self._sx(x) + sx
-
-        def Y(y: float) -> float:
-            return self._sy(y) + sy
-
-        # Background (full canvas already bg, but draw a vignette-ish border)
-        cw = self.canvas.winfo_width()
-        ch = self.canvas.winfo_height()
-        self.canvas.create_rectangle(0, 0, cw, ch, fill="#05030f", outline="")
-        self.canvas.create_rectangle(self._sx(0), self._sy(0), self._sx(self.W), self._sy(self.H), fill=self.BG, outline="")
-
-        # Neon grid (subtle)
-        grid_color = "#2a1655"
-        step = 40
-        for gx in range(0, int(self.W) + 1, step):
-            self.canvas.create_line(X(gx), Y(0), X(gx), Y(self.H), fill=grid_color, width=1)
-        for gy in range(0, int(self.H) + 1, step):
-            self.canvas.create_line(X(0), Y(gy), X(self.W), Y(gy), fill=grid_color, width=1)
-
-        # Segments (walls)
-        for seg in self.segs:
-            color = self.SLING if seg.kind == "slingshot" else self.WALL
-            w = self._sw(5)
-            # Faux glow: draw thick darker line under, then normal
-            self.canvas.create_line(X(seg.p1.x), Y(seg.p1.y), X(seg.p2.x), Y(seg.p2.y), fill=color, width=w + self._sw(6), capstyle="round")
-            self.canvas.create_line(X(seg.p1.x), Y(seg.p1.y), X(seg.p2.x), Y(seg.p2.y), fill=color, width=w, capstyle="round")
-
-        # Bumpers
-        for b in self.bumpers:
+            # Jitter from a tiny LCG (upper bits, the low ones cycle quickly);
+            # looks the same as random.uniform for a wobble, at a fraction of the cost
+            rng = (self._shake_rng * 1103515245 + 12345) & 0x7FFFFFFF
+            sx = ((rng >> 16 & 0xFF) / 127.5 - 1.0) * shake_px
+            rng = (rng * 1103515245 + 12345) & 0x7FFFFFFF
+            sy = ((rng >> 16 & 0xFF) / 127.5 - 1.0) * shake_px
+            self._shake_rng = rng
+
+        # Logical -> screen transform as plain locals, with this frame's shake folded in
+        sc, ox, oy = self._transform
+        ox += sx
+        oy += sy
+
+        # Static table items share the "shake" tag, so one move shifts them all
+        dx = sx - self._shake_x
+        dy = sy - self._shake_y
+        if dx or dy:
+            self.canvas.move("shake", dx, dy)
+            self._shake_x = sx
+            self._shake_y = sy
+
+        # Bumpers (only the flash colour changes)
+        for i, b in enumerate(self.bumpers):
             col = "#ffffff" if b.flash_frames > 0 else b.base_color
             if b.flash_frames > 0:
                 b.flash_frames -= 1
-            r = self._sw(b.r)
-            self.canvas.create_oval(X(b.pos.x - b.r), Y(b.pos.y - b.r), X(b.pos.x + b.r), Y(b.pos.y + b.r),
-                                    fill=col, outline="")
-            # inner ring
-            self.canvas.create_oval(X(b.pos.x - b.r * 0.6), Y(b.pos.y - b.r * 0.6),
-                                    X(b.pos.x + b.r * 0.6), Y(b.pos.y + b.r * 0.6),
-                                    outline="#330033", width=self._sw(2))
+            if self._bumper_fills[i] != col:
+                self._bumper_fills[i] = col
+                self.canvas.itemconfig(self._bumper_ids[i][0], fill=col)
 
         # Flippers
-        self._draw_flipper(self.left, X, Y)
-        self._draw_flipper(self.right, X, Y)
+        self._draw_flipper(self.left, self._flipper_ids[0], sc, ox, oy)
+        self._draw_flipper(self.right, self._flipper_ids[1], sc, ox, oy)
 
         # Ball
         if self.ball.active:
-            r = self.ball.r
-            # glow underlay
-            self.canvas.create_oval(X(self.ball.pos.x - r * 1.6), Y(self.ball.pos.y - r * 1.6),
-                                    X(self.ball.pos.x + r * 1.6), Y(self.ball.pos.y + r * 1.6),
-                                    fill="#cccccc", outline="")
-            self.canvas.create_oval(X(self.ball.pos.x - r), Y(self.ball.pos.y - r),
-                                    X(self.ball.pos.x + r), Y(self.ball.pos.y + r),
-                                    fill=self.BALL, outline="")
+            bx = ox + self.ball.pos.x * sc
+            by = oy + self.ball.pos.y * sc
+            r = self.ball.r * 1.3 * sc
+            self.canvas.coords(self._ball_id, bx - r, by - r, bx + r, by + r)
+        if self.ball.active != self._ball_shown:
+            self.canvas.itemconfig(self._ball_id, state="normal" if self.ball.active else "hidden")
+            self._ball_shown = self.ball.active
 
         # HUD (score + lives)
-        self.canvas.create_text(self._sx(self.W / 2), self._sy(40), text=str(self.score),
-                                fill=self.TARGET, font=("Arial Black", int(self._sw(28))))
-        self.canvas.create_text(self._sx(self.W / 2), self._sy(78), text=f"BALLS: {self.lives}",
-                                fill=self.FLIPPER, font=("Verdana", int(self._sw(14)), "bold"))
+        if self._hud != (self.score, self.lives):
+            self._hud = (self.score, self.lives)
+            self.canvas.itemconfig(self._score_id, text=str(self.score))
+            self.canvas.itemconfig(self._lives_id, text=f"BALLS: {self.lives}")
 
         # Overlay
         if self.state in ("start", "gameover"):
-            self._draw_overlay()
-
-    def _draw_flipper(self, f: Flipper, X, Y) -> None:
-        # Draw a thin rectangle rotated by f.angle.
-        # Axis direction
-        ax = math.cos(f.angle)
-        ay = math.sin(f.angle)
-        # Perpendicular direction
-        px = -ay
-        py = ax
-
-        half_w = f.width / 2
-        p1 = f.pivot
-        p2 = f.tip()
-
-        # Rectangle corners around segment p1->p2
-        a = Vec(p1.x + px * half_w, p1.y + py * half_w)
-        b = Vec(p1.x - px * half_w, p1.y - py * half_w)
-        c = Vec(p2.x - px * half_w, p2.y - py * half_w)
-        d = Vec(p2.x + px * half_w, p2.y + py * half_w)
-
-        pts = [X(a.x), Y(a.y), X(b.x), Y(b.y), X(c.x), Y(c.y), X(d.x), Y(d.y)]
-
-        # Faux glow by drawing a bigger polygon under
-        self.canvas.create_polygon(pts, fill=self.FLIPPER, outline="")
+            if self._overlay_state != self.state:
+                self._draw_overlay()
+        elif self._overlay_state:
+            self.canvas.delete("overlay")
+            self._overlay_state = ""
+
+    def _draw_flipper(self, f: Flipper, item: int, sc: float, ox: float, oy: float) -> None:
+        # Corners are kept up to date by Flipper.update; only the viewport transform is left
+        ax, ay, bx, by, cx, cy, dx, dy = f.corners
+        self.canvas.coords(item, ox + ax * sc, oy + ay * sc, ox + bx * sc, oy + by * sc,
+                           ox + cx * sc, oy + cy * sc, ox + dx * sc, oy + dy * sc)
 
     def _draw_overlay(self) -> None:
-        cw = self.canvas.winfo_width()
-        ch = self.canvas.winfo_height()
+        cw, ch = self._cw, self._ch
+
+        self.canvas.delete("overlay")
+        self._overlay_state = self.state
 
         # Dim screen
-        self.canvas.create_rectangle(0, 0, cw, ch, fill="#000000", outline="")
+        self.canvas.create_rectangle(0, 0, cw, ch, fill="#000000", outline="", tags="overlay")
 
         title = "SPACE PINBALL" if self.state == "start" else "GAME OVER"
         btn = "PLAY" if self.state == "start" else "PLAY AGAIN"
 
         self.canvas.create_text(cw / 2, ch / 2 - 80, text=title, fill=self.BUMPER,
-                                font=("Arial Black", int(min(cw, ch) * 0.06)))
+                                font=("Arial Black", int(min(cw, ch) * 0.06)), tags="overlay")
         self.canvas.create_text(cw / 2, ch / 2 - 35,
                                 text="Left/Right arrows = flippers   Space/Down = launch",
-                                fill="#dddddd", font=("Verdana", 12))
+                                fill="#dddddd", font=("Verdana", 12), tags="overlay")
 
         # Button
         bw, bh = 240, 60
@@ -621,9 +963,10 @@ class PinballGame:
         y2 = ch / 2 + 20 + bh
         self.btn_rect = (x1, y1, x2, y2)
 
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill="#222222", outline=self.FLIPPER, width=3)
+        self.canvas.create_rectangle(x1, y1, x2, y2, fill="#222222", outline=self.FLIPPER, width=3,
+                                     tags="overlay")
         self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=btn, fill="#ffffff",
-                                font=("Arial Black", 22))
+                                font=("Arial Black", 22), tags="overlay")
 
     def run(self) -> None:
         self.root.mainloop()